@@ -4,6 +4,7 @@ from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QIcon
 from PySide6.QtCore import QFile, QIODevice, QTextStream
 
+from modules.app_paths import resource_path
 from modules.main_window import MainWindow
 from modules.drawer_data_manager import DataManager  # 导入统一数据管理器
 
@@ -17,13 +18,13 @@ if __name__ == "__main__":
     app = QApplication(sys.argv)
 
     # Set Application Icon (same as tray icon)
-    app_icon = QIcon("asset/drawer.icon.4.ico")
+    app_icon = QIcon(resource_path("asset/drawer.icon.4.ico"))
     if app_icon.isNull():
         logging.warning("Application icon file 'asset/drawer.icon.4.ico' not found or invalid.")
     app.setWindowIcon(app_icon)
 
     # Load and apply the stylesheet using QTextStream
-    style_file = QFile("modules/style.qss")
+    style_file = QFile(resource_path("modules/style.qss"))
     if style_file.open(QIODevice.OpenModeFlag.ReadOnly | QIODevice.OpenModeFlag.Text):
         stream = QTextStream(style_file)
         stylesheet = stream.readAll()
@@ -52,7 +53,7 @@ if __name__ == "__main__":
     try:
         if mainWindow.controller:
             drawers_data = mainWindow.controller._drawers_data
-            drawer_paths = [path for d in drawers_data if (path := d.get("path")) and isinstance(path, str)]
+            drawer_paths = [d.path for d in drawers_data if d.path]
         else:
             logging.error("MainWindow.controller 未初始化，无法获取抽屉目录")
     except Exception as e:
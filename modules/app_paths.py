@@ -0,0 +1,25 @@
+import os
+import sys
+
+# Nuitka 编译的模块全局命名空间中带有 __compiled__；PyInstaller 等打包工具设置 sys.frozen
+IS_COMPILED: bool = "__compiled__" in globals() or bool(getattr(sys, "frozen", False))
+
+# 随程序分发的资源（asset/、modules/style.qss）所在目录；onefile 打包时是临时解包目录
+RESOURCE_DIR: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 真正启动的可执行文件；onefile 打包时 sys.argv[0] 指向原始 exe，而不是解包目录中的副本。
+# 在导入时取绝对路径，不受之后工作目录变化的影响
+APP_EXECUTABLE: str = os.path.abspath(sys.argv[0]) if IS_COMPILED else sys.executable
+
+# 用户数据（设置文件）所在目录：打包后为 exe 所在目录，源码运行时为 main.py 所在目录
+APP_DIR: str = os.path.dirname(APP_EXECUTABLE) if IS_COMPILED else RESOURCE_DIR
+
+
+def resource_path(relative_path: str) -> str:
+    """资源文件的绝对路径；传入绝对路径时原样返回。"""
+    return os.path.join(RESOURCE_DIR, relative_path)
+
+
+def app_data_path(relative_path: str) -> str:
+    """用户数据文件的绝对路径；传入绝对路径时原样返回。"""
+    return os.path.join(APP_DIR, relative_path)
@@ -1,22 +1,36 @@
+import os
+import sys
 import logging
-from typing import List, Optional, TYPE_CHECKING, Tuple
-from PySide6.QtCore import QObject, QPoint, QSize, Slot, Signal
-from PySide6.QtWidgets import QListWidgetItem, QMessageBox
-from modules.settings_manager import SettingsManager, DrawerDict
-from pathlib import Path
+import time
+import weakref
+from typing import Dict, List, Optional, Set, TYPE_CHECKING, Tuple
+from PySide6.QtCore import (
+    QCoreApplication,
+    QObject,
+    QPoint,
+    QSize,
+    QTimer,
+    Slot,
+    Signal,
+)
+from PySide6.QtWidgets import QListWidgetItem
+from modules.app_paths import APP_EXECUTABLE, IS_COMPILED
+from modules.settings_manager import SettingsManager, SettingsWriter, Drawer
 
 from modules.icon_loader import _initialize_icon_components, get_icon_provider
 from modules.icon_dispatcher import DefaultIconProvider
 from modules.drawer_data_manager import DataManager, FileInfo
 
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
-)
-
 if TYPE_CHECKING:
     from modules.main_window import MainWindow
 
 USER_ROLE: int = 32  # Qt.ItemDataRole.UserRole starts at 32
+SAVE_DEBOUNCE_MS: int = 500
+DIR_CHECK_TTL: float = 2.0  # 秒；短时间内重复点击同一抽屉不再访问文件系统
+DIR_CHECK_CACHE_MAX: int = 256
+INITIAL_DRAWER_BATCH: int = 20  # 启动时同步填充的抽屉数，其余在下一轮事件循环追加
+STARTUP_RUN_KEY: str = r"Software\Microsoft\Windows\CurrentVersion\Run"
+STARTUP_VALUE_NAME: str = "iconDrawer"
 
 
 class AppController(QObject):
@@ -24,7 +38,10 @@ class AppController(QObject):
     应用控制器，管理状态和逻辑，协调视图(MainWindow)与数据(SettingsManager)。
     """
 
-    showDrawerContent = Signal(dict, QSize)
+    # 未保存过尺寸的抽屉使用的内容区尺寸；共享实例，只读
+    DEFAULT_CONTENT_SIZE: QSize = QSize(640, 480)
+
+    showDrawerContent = Signal(object, QSize)
     hideDrawerContent = Signal()
     updateDrawerContent = Signal(str)
 
@@ -32,9 +49,28 @@ class AppController(QObject):
         self, main_view: "MainWindow", parent: Optional[QObject] = None
     ) -> None:
         super().__init__(parent)
-        self._main_view = main_view
+        # MainWindow 持有 controller，这里只保留弱代理，避免 view <-> controller 循环引用。
+        # 代理不能直接作为 Qt 参数传递，需要父窗口时用 self._main_view.window()
+        self._main_view = weakref.proxy(main_view)
         self.settings_manager = SettingsManager()
-        self._drawers_data: List[DrawerDict] = []
+        self._drawers_data: List[Drawer] = []
+        # name -> _drawers_data 下标；同名抽屉只记录第一个，与线性查找结果一致
+        self._drawer_index: Dict[str, int] = {}
+        # 已添加抽屉的规范化路径（见 _path_key），用于 O(1) 重复检查；
+        # realpath 可能很慢（离线网络路径），首次添加抽屉时才生成，None 表示尚未生成
+        self._drawer_paths: Optional[Set[str]] = None
+        # 交给写线程的抽屉快照，建好后不再修改；抽屉增减或尺寸变化时置 None 重建
+        self._drawers_snapshot: Optional[List[Drawer]] = None
+        # 与快照同时生成的纯值元组，用于判断持久化状态是否变化
+        self._drawers_state_key: Tuple = ()
+        # 最近一次提交给写线程的完整状态；未变化时连快照都不提交
+        self._last_submitted_state: Optional[Tuple] = None
+        # 自上次提交保存以来是否有需要持久化的修改；后台写入失败时也会重新置 True
+        self._dirty: bool = False
+        # path -> (检查时间, 是否为目录)
+        self._dir_check_cache: Dict[str, Tuple[float, bool]] = {}
+        # 已提示过无效的抽屉路径；同一个坏抽屉反复点击只提示一次，路径恢复后重新计
+        self._warned_paths: Set[str] = set()
         self._window_position: Optional[QPoint] = None
         self._background_color_hsla: Tuple[int, int, int, float] = (
             self.settings_manager.DEFAULT_BG_COLOR_HSLA
@@ -56,9 +92,21 @@ class AppController(QObject):
             self.settings_manager.DEFAULT_THUMBNAIL_SIZE.height,
         )
         self._locked: bool = False
-        self._locked_item_data: Optional[DrawerDict] = None
+        self._locked_item_data: Optional[Drawer] = None
+        # 最近一次实际写入系统的启动项状态；None 表示本次运行尚未写过
+        self._last_applied_startup: Optional[bool] = None
         self._extension_icon_map: dict[str, str] = {}
 
+        # 合并短时间内的多次保存（尺寸调整、拖动等），只写一次磁盘
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(SAVE_DEBOUNCE_MS)
+        self._save_timer.timeout.connect(self._write_settings)
+        self._settings_writer = SettingsWriter(on_error=self._on_settings_write_failed)
+        app = QCoreApplication.instance()
+        if app:
+            app.aboutToQuit.connect(self._shutdown_settings_writer)
+
         self.icon_provider: Optional[DefaultIconProvider] = None
         self.drawer_data_manager = DataManager()
         self.drawer_data_manager.directoryChanged.connect(self.on_directory_changed)
@@ -87,7 +135,10 @@ class AppController(QObject):
         ) = self.settings_manager.load_settings()
 
         self._drawers_data = drawers
+        self._drawers_snapshot = None
+        self._rebuild_drawer_index()
         self._window_position = window_pos
+        self._dirty = False
         self._background_color_hsla = bg_color
         self._start_with_windows = start_flag
         self._default_icon_folder_path = icon_folder_path
@@ -96,202 +147,333 @@ class AppController(QObject):
         self._thumbnail_size = thumbnail_qsize
         self._extension_icon_map = extension_icon_map or {}
 
-        self._main_view.populate_drawer_list(self._drawers_data)
+        # 先填充首屏可见的一批，让窗口尽快显示；剩余项在下一轮事件循环追加
+        self._main_view.populate_drawer_list(self._drawers_data[:INITIAL_DRAWER_BATCH])
+        tail = self._drawers_data[INITIAL_DRAWER_BATCH:]
+        if tail:
+            QTimer.singleShot(
+                0, lambda: self._main_view.populate_drawer_list_tail(tail)
+            )
         if self._window_position:
             self._main_view.set_initial_position(self._window_position)
 
-        # 新增：启动监控并预加载所有抽屉内容
-        paths = [d["path"] for d in self._drawers_data if "path" in d]
+        # 启动时只开始监控；抽屉内容在首次打开时由 DrawerContentWidget.update_content 扫描
+        paths = [d.path for d in self._drawers_data if d.path]
         if paths:
             self.drawer_data_manager.start_monitor(paths)
-            for p in paths:
-                self.drawer_data_manager.reload_drawer_content(p)
+
+    def _rebuild_drawer_index(self) -> None:
+        self._drawer_index = {}
+        for i, drawer in enumerate(self._drawers_data):
+            if drawer.name:
+                self._drawer_index.setdefault(drawer.name, i)
+        self._drawer_paths = None
+
+    @staticmethod
+    def _path_key(path: str) -> str:
+        """重复检查用的路径键：解析符号链接、去掉末尾分隔符，Windows 下忽略大小写。"""
+        return os.path.normcase(os.path.realpath(path))
+
+    def _get_drawer_paths(self) -> Set[str]:
+        if self._drawer_paths is None:
+            self._drawer_paths = {self._path_key(d.path) for d in self._drawers_data}
+        return self._drawer_paths
+
+    def _find_drawer(self, name: Optional[str]) -> Optional[Drawer]:
+        """按名称查找抽屉配置（O(1)）。"""
+        if not name:
+            return None
+        idx = self._drawer_index.get(name)
+        if idx is None:
+            return None
+        return self._drawers_data[idx]
+
+    def _is_dir(self, path: str) -> bool:
+        """带短期缓存的目录检查，避免网络路径上的重复 stat。"""
+        now = time.monotonic()
+        entry = self._dir_check_cache.get(path)
+        if entry is not None and now - entry[0] < DIR_CHECK_TTL:
+            return entry[1]
+        is_dir = os.path.isdir(path)
+        if is_dir:
+            if len(self._dir_check_cache) >= DIR_CHECK_CACHE_MAX:
+                self._dir_check_cache.clear()
+            self._dir_check_cache[path] = (now, is_dir)
+        else:
+            # 无效路径会弹出警告，用户修复后再次点击应立即重新检查
+            self._dir_check_cache.pop(path, None)
+        return is_dir
 
     def save_settings(self) -> None:
+        """请求保存当前状态，实际写入延迟到 SAVE_DEBOUNCE_MS 内不再有新请求时。"""
+        self._save_timer.start()
+
+    def flush_pending_save(self) -> None:
+        """如有尚未写入的保存请求，立即提交并等待后台写入完成。"""
+        self._save_timer.stop()
+        if self._dirty:
+            self._write_settings()
+        self._settings_writer.flush(timeout=5.0)
+
+    def _on_settings_write_failed(self) -> None:
+        """
+        由写线程调用：忘记已提交的状态，使下一次保存（包括退出时）重新写入。
+        这里只做简单的属性赋值，不触碰 Qt 对象。
+        """
+        self._last_submitted_state = None
+        self._dirty = True
+
+    def _shutdown_settings_writer(self) -> None:
+        self.flush_pending_save()
+        self._settings_writer.stop()
+
+    def _write_settings(self) -> None:
         """保存当前状态（抽屉列表和窗口位置）。"""
-        current_pos = self._main_view.get_current_position()
-        if current_pos:
-            self._window_position = current_pos
+        if not self._dirty:
+            return
+        self._dirty = False
+
+        # moveEvent 经 update_window_position 实时记录位置；只有从未移动过
+        # （首次运行、配置中没有位置）时才需要向窗口查询
+        if self._window_position is None:
+            try:
+                self._window_position = self._main_view.get_current_position()
+            except ReferenceError:
+                # 窗口已销毁（退出时的最后一次保存），不记录位置
+                pass
+
+        # 提交快照给后台写线程；抽屉与 Qt 值对象复制一份，避免与 UI 线程共享可变状态。
+        # 只移动窗口等不涉及抽屉的保存直接复用上次的快照
+        if self._drawers_snapshot is None:
+            self._drawers_snapshot = [
+                Drawer(d.name, d.path, QSize(d.size) if d.size is not None else None)
+                for d in self._drawers_data
+            ]
+            self._drawers_state_key = tuple(
+                (
+                    d.name,
+                    d.path,
+                    None if d.size is None else (d.size.width(), d.size.height()),
+                )
+                for d in self._drawers_snapshot
+            )
 
-        self.settings_manager.save_settings(
-            drawers=self._drawers_data,
-            window_position=self._window_position,
+        # 拖回原位、重复应用同一设置等情况下状态未变，不必唤醒写线程
+        pos = self._window_position
+        state = (
+            self._drawers_state_key,
+            (pos.x(), pos.y()) if pos else None,
+            self._background_color_hsla,
+            self._start_with_windows,
+            self._default_icon_folder_path,
+            self._default_icon_file_theme,
+            self._default_icon_unknown_theme,
+            (self._thumbnail_size.width(), self._thumbnail_size.height()),
+            tuple(self._extension_icon_map.items()),
+        )
+        if state == self._last_submitted_state:
+            return
+        self._last_submitted_state = state
+
+        window_position = QPoint(pos) if pos else None
+        self._settings_writer.submit(
+            drawers=self._drawers_snapshot,
+            window_position=window_position,
             background_color_hsla=self._background_color_hsla,
             start_with_windows=self._start_with_windows,
             default_icon_folder_path=self._default_icon_folder_path,
             default_icon_file_theme=self._default_icon_file_theme,
             default_icon_unknown_theme=self._default_icon_unknown_theme,
-            thumbnail_size=self._thumbnail_size,
-            extension_icon_map=self._extension_icon_map,
+            thumbnail_size=QSize(self._thumbnail_size),
+            extension_icon_map=dict(self._extension_icon_map),
         )
 
+    @Slot()
     def add_new_drawer(self) -> None:
         """添加新抽屉。"""
         folder_path_str = self._main_view.prompt_for_folder()
         if not folder_path_str:
             return
 
-        folder_path = Path(folder_path_str)
-        if not folder_path.is_dir():
+        if not self._is_dir(folder_path_str):
             logging.error(f"Selected path is not a valid directory: {folder_path_str}")
-            QMessageBox.warning(
-                self._main_view,
+            self._main_view.show_transient_warning(
                 "无效路径",
                 f"选择的路径不是一个有效的文件夹:\n{folder_path_str}",
             )
             return
 
-        if any(d.get("path") == folder_path_str for d in self._drawers_data):
-            QMessageBox.warning(
-                self._main_view,
+        drawer_paths = self._get_drawer_paths()
+        path_key = self._path_key(folder_path_str)
+        if path_key in drawer_paths:
+            self._main_view.show_transient_warning(
                 "重复抽屉",
                 f"路径 '{folder_path_str}' 已经被添加。",
             )
             return
 
-        new_drawer_data: DrawerDict = {
-            "name": folder_path.name,
-            "path": folder_path_str,
-        }
+        # 去掉末尾分隔符后取最后一段；根目录等取不到名称时直接用路径
+        name = os.path.basename(folder_path_str.rstrip("/\\")) or folder_path_str
+        new_drawer_data = Drawer(name=name, path=folder_path_str)
         self._drawers_data.append(new_drawer_data)
+        self._drawer_index.setdefault(
+            new_drawer_data.name, len(self._drawers_data) - 1
+        )
+        drawer_paths.add(path_key)
+        self._drawers_snapshot = None
+        self._dirty = True
         self._main_view.add_drawer_item(new_drawer_data)
         self.save_settings()
-        self.drawer_data_manager.reload_drawer_content(folder_path_str)
 
     def update_drawer_size(self, drawer_name: str, new_size: QSize) -> None:
         """更新指定抽屉的尺寸信息。"""
-        for drawer in self._drawers_data:
-            if drawer.get("name") == drawer_name:
-                if drawer.get("size") != new_size:
-                    drawer["size"] = new_size
-                    self.save_settings()
-                break
+        drawer = self._find_drawer(drawer_name)
+        if drawer is not None and drawer.size != new_size:
+            drawer.size = new_size
+            self._drawers_snapshot = None
+            self._dirty = True
+            self.save_settings()
 
+    @Slot(QPoint)
     def update_window_position(self, pos: QPoint) -> None:
         """更新窗口位置（仅内存）。"""
         if self._window_position != pos:
             self._window_position = pos
+            self._dirty = True
 
     def get_preloaded_file_list(self, drawer_path: str) -> Optional[List[FileInfo]]:
         """通过 DataManager 获取预加载文件列表。"""
         self._last_requested_folder = drawer_path
         return self.drawer_data_manager.get_file_list(drawer_path)
 
+    @Slot(str)
     def on_directory_changed(self, path: str) -> None:
         """目录变动时刷新内容。"""
         self.updateDrawerContent.emit(path)
 
+    @Slot(QListWidgetItem)
     def handle_item_selected(self, item: QListWidgetItem) -> None:
         """处理抽屉列表项选中及锁定逻辑。"""
         drawer_data = item.data(USER_ROLE)
-        if not isinstance(drawer_data, dict):
+        if not isinstance(drawer_data, Drawer):
             logging.error(f"Invalid data in selected item '{item.text()}'.")
             return
 
-        folder_path_str = drawer_data.get("path")
-        if not folder_path_str or not Path(folder_path_str).is_dir():
-            logging.error(
-                f"Invalid or non-existent path for item '{item.text()}': {folder_path_str}"
-            )
-            QMessageBox.warning(
-                self._main_view,
-                "路径无效",
-                f"抽屉 '{item.text()}' 的路径无效或不存在:\n{folder_path_str}\n请考虑移除此抽屉。",
-            )
+        # 再次点击已锁定的抽屉：直接解锁隐藏，无需检查路径和查找配置
+        if self._locked and drawer_data is self._locked_item_data:
+            self._locked = False
+            self._locked_item_data = None
+            self.hideDrawerContent.emit()
             return
 
-        current_drawer_config = None
-        drawer_name_to_find = drawer_data.get("name")
-        if drawer_name_to_find:
-            for config in self._drawers_data:
-                if config.get("name") == drawer_name_to_find:
-                    current_drawer_config = config
-                    break
-
-        if current_drawer_config:
-            target_content_size = current_drawer_config.get("size")
-            if not isinstance(target_content_size, QSize):
-                target_content_size = QSize(640, 480)
-            item.setData(USER_ROLE, current_drawer_config)
-        else:
-            logging.warning(
-                f"Could not find '{drawer_name_to_find}' in current config, using item data size."
-            )
-            target_content_size = drawer_data.get("size")
-            if not isinstance(target_content_size, QSize):
-                target_content_size = QSize(640, 480)
+        folder_path_str = drawer_data.path
+        if not folder_path_str or not self._is_dir(folder_path_str):
+            if folder_path_str not in self._warned_paths:
+                self._warned_paths.add(folder_path_str)
+                logging.error(
+                    f"Invalid or non-existent path for item '{item.text()}': {folder_path_str}"
+                )
+                self._main_view.show_transient_warning(
+                    "路径无效",
+                    f"抽屉 '{item.text()}' 的路径无效或不存在:\n{folder_path_str}\n请考虑移除此抽屉。",
+                )
+            return
+        self._warned_paths.discard(folder_path_str)
+
+        target_drawer, target_content_size = self._resolve_selected_drawer(
+            item, drawer_data
+        )
 
         if self._locked:
-            compare_data = (
-                current_drawer_config if current_drawer_config else drawer_data
-            )
-            if compare_data == self._locked_item_data:
+            # Drawer 对象来自 _drawers_data，同一抽屉即同一对象，按身份比较即可
+            if target_drawer is self._locked_item_data:
                 self._locked = False
                 self._locked_item_data = None
                 self.hideDrawerContent.emit()
             else:
-                if self._locked_item_data:
-                    old_drawer_name = self._locked_item_data.get("name")
-                    if old_drawer_name:
-                        old_size = self._main_view.get_drawer_content_size()
-                        self.update_drawer_size(old_drawer_name, old_size)
-                self._locked_item_data = compare_data
-                self.showDrawerContent.emit(self._locked_item_data, target_content_size)
+                if self._persist_locked_size():
+                    self.save_settings()
+                self._locked_item_data = target_drawer
+                self.showDrawerContent.emit(target_drawer, target_content_size)
         else:
             self._locked = True
-            self._locked_item_data = (
-                current_drawer_config if current_drawer_config else drawer_data
+            self._locked_item_data = target_drawer
+            self.showDrawerContent.emit(target_drawer, target_content_size)
+
+    def _resolve_selected_drawer(
+        self, item: QListWidgetItem, drawer_data: Drawer
+    ) -> Tuple[Drawer, QSize]:
+        """
+        返回选中项对应的抽屉配置及内容区目标尺寸。
+        优先使用 _drawers_data 中的对象；找不到时退回列表项自身的数据。
+        """
+        current_drawer_config = self._find_drawer(drawer_data.name)
+        if current_drawer_config is None:
+            logging.warning(
+                f"Could not find '{drawer_data.name}' in current config, using item data size."
             )
-            self.showDrawerContent.emit(self._locked_item_data, target_content_size)
+            current_drawer_config = drawer_data
+        elif current_drawer_config is not drawer_data:
+            # 列表项已指向当前配置对象时不再 setData，避免触发 dataChanged
+            item.setData(USER_ROLE, current_drawer_config)
 
+        target_content_size = current_drawer_config.size
+        if not isinstance(target_content_size, QSize):
+            target_content_size = self.DEFAULT_CONTENT_SIZE
+        return current_drawer_config, target_content_size
+
+    def _persist_locked_size(self) -> bool:
+        """
+        把内容区当前尺寸记入锁定的抽屉配置（不触发保存）。
+        返回尺寸是否有变化。
+        """
+        if not self._locked or not self._locked_item_data:
+            return False
+        drawer = self._find_drawer(self._locked_item_data.name)
+        # 只有锁定的抽屉仍在配置中时才需要读取内容区尺寸
+        if drawer is None:
+            return False
+        current_size = self._main_view.get_drawer_content_size()
+        if drawer.size == current_size:
+            return False
+        drawer.size = current_size
+        self._drawers_snapshot = None
+        self._dirty = True
+        return True
+
+    @Slot()
     def handle_selection_cleared(self) -> None:
         """列表选择清除时隐藏内容（若未锁定）。"""
         if not self._locked:
             self.hideDrawerContent.emit()
 
+    @Slot()
     def handle_content_close_requested(self) -> None:
         """内容关闭请求处理，保存尺寸并隐藏内容。"""
-        if self._locked and self._locked_item_data:
-            drawer_name = self._locked_item_data.get("name")
-            if drawer_name:
-                current_size = self._main_view.get_drawer_content_size()
-                self.update_drawer_size(drawer_name, current_size)
+        if self._persist_locked_size():
+            self.save_settings()
 
         self._locked = False
         self._locked_item_data = None
         self.hideDrawerContent.emit()
         self._main_view.clear_list_selection()
 
+    @Slot()
     def handle_content_resize_finished(self) -> None:
         """内容尺寸调整完成时保存尺寸。"""
-        if self._locked and self._locked_item_data:
-            current_size = self._main_view.get_drawer_content_size()
-            drawer_name = self._locked_item_data.get("name")
-            if drawer_name:
-                self.update_drawer_size(drawer_name, current_size)
+        if self._persist_locked_size():
+            self.save_settings()
 
+    @Slot()
     def handle_window_drag_finished(self) -> None:
         """窗口拖动完成时保存位置和尺寸。"""
-        current_pos = self._main_view.get_current_position()
-        if current_pos and self._window_position != current_pos:
-            self._window_position = current_pos
-
-        if self._locked and self._locked_item_data:
-            current_size = self._main_view.get_drawer_content_size()
-            drawer_name = self._locked_item_data.get("name")
-            if drawer_name:
-                for drawer in self._drawers_data:
-                    # Ensure drawer has a "size" key before comparing
-                    if drawer.get("name") == drawer_name:
-                        if (
-                            not isinstance(drawer.get("size"), QSize)
-                            or drawer.get("size") != current_size
-                        ):
-                            drawer["size"] = current_size
-                        break
-
-        self.save_settings()
+        self._persist_locked_size()
+        # 拖动中 moveEvent 经 update_window_position 记录位置并标记 _dirty；
+        # 点击拖动区域但未实际移动时无需写盘
+        if self._dirty:
+            self.save_settings()
 
+    @Slot()
     def handle_settings_requested(self) -> None:
         """打开设置对话框。"""
         self._main_view.show_settings_dialog()
@@ -309,6 +491,7 @@ class AppController(QObject):
         )
         if self._background_color_hsla != new_color_css:
             self._background_color_hsla = new_color_css
+            self._dirty = True
             self.save_settings()
             logging.info(f"Background color updated to (CSS format): {new_color_css}")
 
@@ -317,13 +500,48 @@ class AppController(QObject):
         """处理启动项开关。"""
         if self._start_with_windows != enabled:
             self._start_with_windows = enabled
+            self._dirty = True
             self.save_settings()
             logging.info(f"Start with Windows setting updated to: {enabled}")
             self._update_startup_registry(enabled)
 
     def _update_startup_registry(self, enable: bool) -> None:
-        """平台相关启动项逻辑占位符。"""
-        if enable:
-            logging.info("Placeholder: Adding application to system startup.")
+        """写入/移除开机启动项；平台模块只在真正需要时导入。"""
+        if self._last_applied_startup == enable:
+            return
+        if sys.platform != "win32":
+            logging.info(
+                f"Start with system is not supported on {sys.platform}, skipping."
+            )
+            return
+
+        import winreg
+
+        # 设置与资源路径由 app_paths 解析，不依赖启动项的工作目录
+        if IS_COMPILED:
+            # 打包版本注册真正的 exe，而不是 onefile 的临时解包目录
+            command = f'"{APP_EXECUTABLE}"'
         else:
-            logging.info("Placeholder: Removing application from system startup.")
+            # 用 pythonw.exe 启动，避免开机时弹出控制台窗口；
+            # __main__.__file__ 是绝对路径，不受当前工作目录影响
+            pythonw = os.path.join(os.path.dirname(sys.executable), "pythonw.exe")
+            interpreter = pythonw if os.path.exists(pythonw) else sys.executable
+            command = f'"{interpreter}" "{sys.modules["__main__"].__file__}"'
+        try:
+            with winreg.OpenKey(
+                winreg.HKEY_CURRENT_USER, STARTUP_RUN_KEY, 0, winreg.KEY_SET_VALUE
+            ) as key:
+                if enable:
+                    winreg.SetValueEx(
+                        key, STARTUP_VALUE_NAME, 0, winreg.REG_SZ, command
+                    )
+                else:
+                    try:
+                        winreg.DeleteValue(key, STARTUP_VALUE_NAME)
+                    except FileNotFoundError:
+                        pass
+        except OSError as e:
+            logging.error(f"Failed to update startup registry entry: {e}")
+            return
+        self._last_applied_startup = enable
+        logging.info(f"Startup registry entry {'added' if enable else 'removed'}.")
@@ -96,7 +96,9 @@ class DrawerWatchdogManager(QObject):
                 try:
                     src_path_str = os.fsdecode(event.src_path)
                     logging.debug(
-                        f"Watchdog captured event: {event.event_type} - {src_path_str}"
+                        "Watchdog captured event: %s - %s",
+                        event.event_type,
+                        src_path_str,
                     )
                     manager._handle_event(src_path_str)
                 except Exception as e:
@@ -119,12 +121,15 @@ class DrawerWatchdogManager(QObject):
                     break
             if affected_root_path:
                 logging.debug(
-                    f"Event path '{normalized_event_path}' belongs to monitored root '{affected_root_path}'. Requesting refresh schedule."
+                    "Event path '%s' belongs to monitored root '%s'. Requesting refresh schedule.",
+                    normalized_event_path,
+                    affected_root_path,
                 )
                 self._scheduleRefreshRequested.emit(affected_root_path)
             else:
                 logging.debug(
-                    f"Event path '{normalized_event_path}' not within any monitored root directory. Ignoring."
+                    "Event path '%s' not within any monitored root directory. Ignoring.",
+                    normalized_event_path,
                 )
         except Exception as e:
             logging.error(f"Error handling watchdog event for path {event_path}: {e}")
@@ -133,7 +138,7 @@ class DrawerWatchdogManager(QObject):
     def _processRefreshRequest(self, root_path: str):
         with self._lock:
             if root_path in self._pending_refreshes:
-                logging.debug(f"Debouncing refresh for {root_path}. Restarting timer.")
+                logging.debug("Debouncing refresh for %s. Restarting timer.", root_path)
                 self._pending_refreshes[root_path].start(200)
                 return
             logging.info(f"Scheduling delayed refresh signal for: {root_path}")
@@ -205,7 +210,7 @@ class DataManager(QObject):
                 if file_list:
                     break
             self._file_cache[drawer_path] = file_list
-            logging.debug(f"同步刷新抽屉内容完成: {drawer_path}, 共{len(file_list)}项")
+            logging.debug("同步刷新抽屉内容完成: %s, 共%s项", drawer_path, len(file_list))
             return file_list
         except Exception as e:
             logging.error(f"同步刷新抽屉内容失败: {drawer_path}, 错误: {e}")
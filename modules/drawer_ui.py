@@ -1,7 +1,7 @@
 import os
-import shutil
 import logging
-from typing import Optional, Callable, TYPE_CHECKING, List
+import threading
+from typing import Optional, Callable, TYPE_CHECKING, Dict, List, Set, Tuple
 
 from PySide6.QtWidgets import (
     QWidget,
@@ -15,7 +15,9 @@ from PySide6.QtWidgets import (
     QPushButton,
 )
 from PySide6.QtGui import (
+    QFont,
     QIcon,
+    QPixmap,
     QDesktopServices,
     QFontMetrics,
     QResizeEvent,
@@ -25,16 +27,47 @@ from PySide6.QtGui import (
     QDragMoveEvent,
     QDropEvent,
     QDragLeaveEvent,
+    QShowEvent,
+)
+from PySide6.QtCore import (
+    Qt,
+    QSize,
+    QUrl,
+    Signal,
+    QThread,
+    QThreadPool,
+    QEvent,
+    QTimer,
 )
-from PySide6.QtCore import Qt, QSize, QUrl, Signal, QThreadPool
 
 from .drawer_custom_size_grip import CustomSizeGrip
-from .utils import calculate_available_label_width
+from .utils import (
+    HeaderMetrics,
+    calculate_available_label_width,
+    collect_header_metrics,
+    text_metrics_for,
+    truncate_text,
+)
 from .file_item import FileIconWidget
+from .icon_loader import (
+    ICON_DISPATCH_CHUNK_SIZE,
+    BatchIconLoadWorker,
+    IconWorkerSignals,
+)
+from .file_transfer import FileTransferSignals, FileTransferWorker
 
 if TYPE_CHECKING:
     from .controller import AppController, FileInfo
 
+# 热路径上频繁使用的 Qt 枚举与尺寸，导入时绑定为模块常量
+_ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
+_ELIDE_LEFT = Qt.TextElideMode.ElideLeft
+_ELIDE_WIDTH_STEP = 8
+_DISPLAY_TEXT_CACHE_MAX = 4096
+_BTN_LEFT = Qt.MouseButton.LeftButton
+_ICON_SIZE_96 = QSize(96, 96)  # 所有实例共享，只读
+_EMPTY_ICON = QIcon()  # 图标缺失时的共享空图标，只读
+
 
 class ClickableWidget(QWidget):
     """可点击容器，支持设置点击回调。"""
@@ -44,7 +77,7 @@ class ClickableWidget(QWidget):
         self.click_callback: Optional[Callable[[], None]] = None
 
     def mousePressEvent(self, event: QMouseEvent) -> None:
-        if event.button() == Qt.MouseButton.LeftButton and self.click_callback:
+        if event.button() == _BTN_LEFT and self.click_callback:
             self.click_callback()
             event.accept()
         else:
@@ -58,6 +91,11 @@ class DrawerContentWidget(QWidget):
     sizeChanged = Signal(QSize)
     resizeFinished = Signal()
 
+    # 头部 16px 文件夹图标，所有抽屉实例共享同一个 QPixmap
+    _FOLDER_HEADER_PM: Optional[QPixmap] = None
+    # (kind, width, height) -> 占位图标 QPixmap，所有抽屉实例共享
+    _PLACEHOLDER_PM_CACHE: Dict[Tuple[str, int, int], QPixmap] = {}
+
     def __init__(
         self, controller: "AppController", parent: Optional[QWidget] = None
     ) -> None:
@@ -65,12 +103,51 @@ class DrawerContentWidget(QWidget):
         self.controller = controller
         self.setAcceptDrops(True)
         self.current_folder = ""
-        self.icon_size = QSize(96, 96)
+        self.icon_size = _ICON_SIZE_96
         self.item_size = (100, 120)
-        self.items: List[FileIconWidget] = []
+        # 当前文件夹的全部文件项（纯数据），只为视口内的行创建/复用部件
+        self.items: List["FileInfo"] = []
+        self._item_pool: List[FileIconWidget] = []
+        self._loaded_pixmaps: Dict[int, QPixmap] = {}
+        self._pixmaps_by_icon_key: Dict[int, QPixmap] = {}
+        self._bound_range: Tuple[int, int] = (0, 0)
+        # 文件名截断所需的字体度量，字体或样式变化前一直复用
+        self._item_fm: Optional[QFontMetrics] = None
+        self._sample_label: Optional[QLabel] = None
+        self._item_chars_per_line = 1
+        # 文件名 -> 截断后的显示文本，跨文件夹复用，字体变化时清空
+        self._display_texts: Dict[str, str] = {}
         self.icon_load_pool = QThreadPool()
+        # 图标加载分片数：留一个核心给 UI 线程，最多 4 个
+        self._icon_shard_count = max(1, min(QThread.idealThreadCount() - 1, 4))
+        self.icon_load_pool.setMaxThreadCount(self._icon_shard_count)
+        self._icon_signals = IconWorkerSignals()
+        self._icon_signals.batch_loaded.connect(self._on_icon_loaded_batch)
+        # 拖放的文件在单线程池中依次传输，避免阻塞 UI，也保证多次拖放按顺序完成
+        self.file_transfer_pool = QThreadPool()
+        self.file_transfer_pool.setMaxThreadCount(1)
+        self._transfer_signals = FileTransferSignals()
+        self._transfer_signals.finished.connect(self._on_files_transferred)
+        # 每次替换文件列表时递增，过期的图标结果按代号丢弃
+        self._load_generation = 0
+        self._load_cancelled = threading.Event()
+        # 已派发过图标加载的 item 下标，避免滚动时重复派发
+        self._dispatched: Set[int] = set()
+        self._columns = 1
+        self._scroll_timer = QTimer(self)
+        self._scroll_timer.setSingleShot(True)
+        self._scroll_timer.setInterval(16)
+        self._scroll_timer.timeout.connect(self._bind_visible_items)
+        # 拖动调整大小时合并多次 resize，约 60Hz 重新布局一次
+        self._relayout_timer = QTimer(self)
+        self._relayout_timer.setSingleShot(True)
+        self._relayout_timer.setInterval(16)
+        self._relayout_timer.timeout.connect(self._on_relayout_timeout)
+        self._last_viewport_width = -1
         self.placeholder_folder_icon: Optional[QIcon] = None
         self.placeholder_file_icon: Optional[QIcon] = None
+        self._placeholder_folder_pm: Optional[QPixmap] = None
+        self._placeholder_file_pm: Optional[QPixmap] = None
 
         self.folder_label: Optional[QLabel] = None
         self.folder_icon_label: Optional[QLabel] = None
@@ -82,7 +159,16 @@ class DrawerContentWidget(QWidget):
         self.scroll_area: Optional[QScrollArea] = None
         self.scroll_widget: Optional[QWidget] = None
         self.grid_layout: Optional[QGridLayout] = None
+        self._loading_label: Optional[QLabel] = None
+        self._drag_inside = False
         self.size_grip: Optional[CustomSizeGrip] = None
+        # (available_width, current_folder) -> elided_text 的最近一次结果
+        self._elided_cache: Optional[Tuple[int, str, str]] = None
+        self._folder_label_fm: Optional[QFontMetrics] = None
+        self._folder_label_font_key: Optional[str] = None
+        # header 中按钮/图标/边距等固定尺寸，字体、样式或屏幕变化时失效
+        self._header_metrics: Optional[HeaderMetrics] = None
+        self._screen_signal_connected = False
 
         self._init_main_container()
         self._load_placeholder_icons()
@@ -97,8 +183,24 @@ class DrawerContentWidget(QWidget):
             logging.warning(
                 "Icon provider not available, using empty icons as fallback."
             )
-            self.placeholder_folder_icon = QIcon()
-            self.placeholder_file_icon = QIcon()
+            self.placeholder_folder_icon = _EMPTY_ICON
+            self.placeholder_file_icon = _EMPTY_ICON
+
+        self._placeholder_folder_pm = self._placeholder_pixmap(
+            "folder", self.placeholder_folder_icon
+        )
+        self._placeholder_file_pm = self._placeholder_pixmap(
+            "file", self.placeholder_file_icon
+        )
+
+    def _placeholder_pixmap(self, kind: str, icon: Optional[QIcon]) -> QPixmap:
+        """取出（或首次生成并缓存）指定类型的占位图标 QPixmap。"""
+        key = (kind, self.icon_size.width(), self.icon_size.height())
+        pixmap = DrawerContentWidget._PLACEHOLDER_PM_CACHE.get(key)
+        if pixmap is None:
+            pixmap = FileIconWidget.render_icon(icon or _EMPTY_ICON, self.icon_size)
+            DrawerContentWidget._PLACEHOLDER_PM_CACHE[key] = pixmap
+        return pixmap
 
     def _init_main_container(self) -> None:
         self.main_visual_container = QWidget(self)
@@ -118,17 +220,28 @@ class DrawerContentWidget(QWidget):
 
         self.scroll_area = QScrollArea()
         self.scroll_area.setObjectName("scrollArea")
+        self.scroll_area.setProperty("dragOver", False)
         self.scroll_area.setWidgetResizable(True)
         self.scroll_area.setHorizontalScrollBarPolicy(
             Qt.ScrollBarPolicy.ScrollBarAlwaysOff
         )
+        # valueChanged(int) 直接连 start 会匹配 start(msec)，把滚动位置当作间隔
+        self.scroll_area.verticalScrollBar().valueChanged.connect(
+            lambda _value: self._scroll_timer.start()
+        )
 
         self.scroll_widget = QWidget()
         self.scroll_widget.setObjectName("scrollWidget")
         self.grid_layout = QGridLayout(self.scroll_widget)
         self.grid_layout.setSpacing(5)
+        # 布局只承载“正在加载”提示，文件项由 _bind_visible_items 直接定位
+        self.grid_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
+        self._grid_margins = self.grid_layout.contentsMargins()
         self.scroll_area.setWidget(self.scroll_widget)
 
+        self._loading_label = QLabel("正在加载...")
+        self._loading_label.setAlignment(_ALIGN_CENTER)
+
         container_layout.addWidget(self.scroll_area, 1, 0)
 
         self.size_grip = CustomSizeGrip(self.main_visual_container)
@@ -156,12 +269,14 @@ class DrawerContentWidget(QWidget):
 
         self.folder_icon_label = QLabel(self.folder_container)
         self.folder_icon_label.setObjectName("folderIconLabel")
-        folder_icon = QIcon()
-        if self.controller and self.controller.icon_provider:
-            folder_icon = self.controller.icon_provider.get_folder_icon()
-        else:
-            logging.error("Icon provider not available, using empty folder icon.")
-        self.folder_icon_label.setPixmap(folder_icon.pixmap(16))
+        if DrawerContentWidget._FOLDER_HEADER_PM is None:
+            folder_icon = _EMPTY_ICON
+            if self.controller and self.controller.icon_provider:
+                folder_icon = self.controller.icon_provider.get_folder_icon()
+            else:
+                logging.error("Icon provider not available, using empty folder icon.")
+            DrawerContentWidget._FOLDER_HEADER_PM = folder_icon.pixmap(16)
+        self.folder_icon_label.setPixmap(DrawerContentWidget._FOLDER_HEADER_PM)
         folder_layout.addWidget(self.folder_icon_label)
 
         self.folder_label = QLabel("", self.folder_container)
@@ -200,39 +315,30 @@ class DrawerContentWidget(QWidget):
             self.folder_label.setText(folder_path)
             self.folder_label.setToolTip(f"click to open: {folder_path}")
 
+        self._cancel_icon_loading()
         self.clear_grid()
         self.items.clear()
+        self._dispatched.clear()
+        self._loaded_pixmaps.clear()
+        self._pixmaps_by_icon_key.clear()
 
         if file_list is None:
             logging.info(f"文件列表为空，显示加载中: {folder_path}")
-            loading_label = QLabel("正在加载...")
-            loading_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            if self.grid_layout:
-                self.grid_layout.addWidget(loading_label, 0, 0)
+            if self.grid_layout and self._loading_label:
+                self._loading_label.setParent(self.scroll_widget)
+                self.grid_layout.addWidget(self._loading_label, 0, 0)
+                self._loading_label.show()
             return
 
         if not file_list:
-            logging.debug(f"文件列表为空或目录为空: {folder_path}")
+            logging.debug("文件列表为空或目录为空: %s", folder_path)
             self._update_folder_label_elided_text()
             return
 
         try:
-            for file_info in file_list:
-                placeholder_icon = (
-                    self.placeholder_folder_icon
-                    if file_info.is_dir
-                    else self.placeholder_file_icon
-                )
-                if not placeholder_icon:
-                    placeholder_icon = QIcon()
-                container_widget = self._create_file_item_placeholder(
-                    file_info, placeholder_icon
-                )
-                self.items.append(container_widget)
-
+            self.items.extend(file_list)
             self.relayout_grid()
             self._update_folder_label_elided_text()
-            self._start_async_icon_loading()
 
         except Exception as e:
             logging.error(f"Error creating file items for {folder_path}: {e}")
@@ -240,22 +346,159 @@ class DrawerContentWidget(QWidget):
 
         self.update()
 
-    def _start_async_icon_loading(self) -> None:
+    def _visible_item_range(self) -> Tuple[int, int]:
+        """返回视口内（外加一行预留）的 item 下标范围 [start, end)。"""
+        if not self.scroll_area or not self.grid_layout:
+            return 0, len(self.items)
+        row_height = self.item_size[1] + max(0, self.grid_layout.verticalSpacing())
+        viewport_height = self.scroll_area.viewport().height() or self.height()
+        scroll_value = self.scroll_area.verticalScrollBar().value()
+        top = max(0, scroll_value - self._grid_margins.top())
+        first_row = top // row_height
+        last_row = (top + viewport_height) // row_height + 1
+        start = min(len(self.items), first_row * self._columns)
+        end = min(len(self.items), (last_row + 1) * self._columns)
+        return start, end
+
+    def _bind_visible_items(self) -> None:
+        """把部件池绑定到当前可见的 item 上，并为其派发图标加载。"""
+        if not self.grid_layout or not self.items:
+            return
+        start, end = self._visible_item_range()
+        if (start, end) == self._bound_range:
+            return
+        self._bound_range = (start, end)
+
+        while len(self._item_pool) < end - start:
+            self._item_pool.append(self._create_file_item_placeholder())
+
+        columns = self._columns
+        margins = self._grid_margins
+        item_w, item_h = self.item_size
+        step_x = item_w + max(0, self.grid_layout.horizontalSpacing())
+        step_y = item_h + max(0, self.grid_layout.verticalSpacing())
+
+        text_available_width = self.item_size[0] - 10
+        fm = self._item_fm
+        if fm is None:
+            fm = QFontMetrics(self._item_text_font())
+            self._item_fm = fm
+            self._item_chars_per_line = text_metrics_for(fm, text_available_width)
+        chars_per_line = self._item_chars_per_line
+        for offset, widget in enumerate(self._item_pool):
+            index = start + offset
+            if index >= end:
+                widget.item_index = -1
+                widget.hide()
+                continue
+            if widget.item_index != index:
+                file_info = self.items[index]
+                display_text = self._display_texts.get(file_info.name)
+                if display_text is None:
+                    display_text = truncate_text(
+                        file_info.name, fm, text_available_width, chars_per_line
+                    )
+                    if len(self._display_texts) >= _DISPLAY_TEXT_CACHE_MAX:
+                        self._display_texts.clear()
+                    self._display_texts[file_info.name] = display_text
+                widget.bind(
+                    index,
+                    file_info.path,
+                    file_info.is_dir,
+                    file_info.name,
+                    display_text,
+                )
+                widget.set_pixmap(self._pixmap_for_item(index))
+            # 文件项不进入 QGridLayout，直接按行列算出位置，滚动时免去布局求解
+            row, col = divmod(index, columns)
+            widget.setGeometry(
+                margins.left() + col * step_x,
+                margins.top() + row * step_y,
+                item_w,
+                item_h,
+            )
+            widget.show()
+
+        self._start_async_icon_loading(start, end)
+
+    def _item_text_font(self) -> QFont:
+        """
+        返回文件名标签实际使用的字体。
+        用一个不显示的样本标签解析样式表，所有文件项共用其结果。
+        """
+        if self._sample_label is None:
+            self._sample_label = QLabel(self.scroll_widget)
+            self._sample_label.hide()
+        self._sample_label.ensurePolished()
+        return self._sample_label.font()
+
+    def _pixmap_for_item(self, index: int) -> QPixmap:
+        pixmap = self._loaded_pixmaps.get(index)
+        if pixmap is not None:
+            return pixmap
+        if self.items[index].is_dir:
+            return self._placeholder_folder_pm or QPixmap()
+        return self._placeholder_file_pm or QPixmap()
+
+    def _cancel_icon_loading(self) -> None:
+        """作废当前一代的图标加载：丢弃排队任务并通知运行中的任务提前退出。"""
+        self._load_cancelled.set()
+        self.icon_load_pool.clear()
+        self._load_cancelled = threading.Event()
+        self._load_generation += 1
+
+    def _start_async_icon_loading(self, start: int, end: int) -> None:
         if not self.items:
             return
+        pending = [i for i in range(start, end) if i not in self._dispatched]
+        if not pending:
+            return
+        self._dispatched.update(pending)
         logging.debug(
-            f"Starting async icon load for {len(self.items)} items in {self.current_folder}"
+            "Starting async icon load for %s items in %s",
+            len(pending),
+            self.current_folder,
         )
-        for item_widget in self.items:
-            if isinstance(item_widget, FileIconWidget):
-                placeholder_icon = (
-                    self.placeholder_folder_icon
-                    if item_widget.is_dir
-                    else self.placeholder_file_icon
-                )
-                if placeholder_icon is None:
-                    placeholder_icon = QIcon()
-                item_widget.load_icon(placeholder_icon, self.icon_size)
+        total = len(pending)
+        chunk_size = (total + self._icon_shard_count - 1) // self._icon_shard_count
+        chunk_size = min(chunk_size, ICON_DISPATCH_CHUNK_SIZE)
+        for offset in range(0, total, chunk_size):
+            widget_ids = pending[offset : offset + chunk_size]
+            paths = [self.items[i].path for i in widget_ids]
+            worker = BatchIconLoadWorker(
+                self._load_generation,
+                paths,
+                widget_ids,
+                self._icon_signals,
+                self._load_cancelled,
+            )
+            self.icon_load_pool.start(worker)
+
+    def _on_icon_loaded_batch(self, generation: int, results: list) -> None:
+        if generation != self._load_generation:
+            return
+        item_count = len(self.items)
+        for widget_id, icon in results:
+            if widget_id >= item_count:
+                continue
+            # 同一个 QIcon（如按扩展名缓存的图标）只栅格化一次
+            icon_key = icon.cacheKey()
+            pixmap = self._pixmaps_by_icon_key.get(icon_key)
+            if pixmap is None:
+                pixmap = FileIconWidget.render_icon(icon, self.icon_size)
+                self._pixmaps_by_icon_key[icon_key] = pixmap
+            self._loaded_pixmaps[widget_id] = pixmap
+            widget = self._widget_for_index(widget_id)
+            if widget is not None:
+                widget.set_pixmap(pixmap)
+
+    def _widget_for_index(self, index: int) -> Optional[FileIconWidget]:
+        """返回当前绑定到 index 的部件；部件池按可见范围顺序绑定，可直接换算。"""
+        start, end = self._bound_range
+        if not start <= index < end:
+            return None
+        widget = self._item_pool[index - start]
+        return widget if widget.item_index == index else None
 
     def _refresh_content(self) -> None:
         if self.current_folder and self.controller:
@@ -282,30 +525,17 @@ class DrawerContentWidget(QWidget):
         if os.path.isdir(self.current_folder):
             QDesktopServices.openUrl(QUrl.fromLocalFile(self.current_folder))
 
-    def _create_file_item_placeholder(
-        self, file_info: "FileInfo", placeholder_icon: QIcon
-    ) -> FileIconWidget:
-        container_widget = FileIconWidget(file_info.path, file_info.is_dir)
+    def _create_file_item_placeholder(self) -> FileIconWidget:
+        """创建一个未绑定的部件，加入部件池后按需绑定到文件项。"""
+        container_widget = FileIconWidget("", False, self.scroll_widget)
         container_widget.setFixedSize(self.item_size[0], self.item_size[1])
-        container_widget.load_icon(placeholder_icon, self.icon_size)
-        text_available_width = self.item_size[0] - 10
-        container_widget.set_text(file_info.name, text_available_width)
+        container_widget.hide()
         return container_widget
 
-    def relayout_grid(self) -> None:
-        if not self.grid_layout:
-            return
-        while self.grid_layout.count():
-            item = self.grid_layout.takeAt(0)
-            if item and item.widget():
-                item.widget().setParent(None)
-
-        if not self.items:
-            return
-
-        if not self.scroll_area or not self.scroll_area.viewport():
-            return
-        viewport_width = self.scroll_area.viewport().width()
+    def _compute_columns(self) -> int:
+        """按当前视口宽度计算网格列数。"""
+        assert self.grid_layout is not None
+        viewport_width = self.scroll_area.viewport().width() if self.scroll_area else 0
         available_width = (
             viewport_width
             if viewport_width > 0
@@ -318,38 +548,63 @@ class DrawerContentWidget(QWidget):
         if item_total_width <= 0:
             item_total_width = self.item_size[0]
 
-        columns = max(1, int(available_width // item_total_width))
+        return max(1, int(available_width // item_total_width))
 
-        row, col = 0, 0
-        for item_widget in self.items:
-            self.grid_layout.addWidget(item_widget, row, col)
-            col += 1
-            if col >= columns:
-                col = 0
-                row += 1
+    def relayout_grid(self) -> None:
+        if not self.grid_layout or not self.items:
+            return
+
+        if not self.scroll_area or not self.scroll_area.viewport():
+            return
+        columns = self._compute_columns()
+        self._columns = columns
+        self._last_viewport_width = self.scroll_area.viewport().width()
 
         rows_needed = (len(self.items) + columns - 1) // columns
+        margins = self._grid_margins
         min_height = rows_needed * (
             self.item_size[1] + self.grid_layout.verticalSpacing()
         )
-        min_height += self.grid_layout.verticalSpacing()
+        min_height += margins.top() + margins.bottom()
 
         if self.scroll_widget:
             self.scroll_widget.setMinimumHeight(min_height)
 
+        self._bound_range = (0, 0)
+        self._bind_visible_items()
+
+    def _on_relayout_timeout(self) -> None:
+        """resize 合并后的重新布局；列数未变时只需按新的视口高度补绑可见项。"""
+        if not self.grid_layout or not self.items:
+            return
+        viewport_width = self.scroll_area.viewport().width() if self.scroll_area else 0
+        width_unchanged = viewport_width == self._last_viewport_width
+        self._last_viewport_width = viewport_width
+        if width_unchanged or self._compute_columns() == self._columns:
+            self._bind_visible_items()
+        else:
+            self.relayout_grid()
+
     def resizeEvent(self, event: QResizeEvent) -> None:
         super().resizeEvent(event)
-        self.relayout_grid()
-        self._update_folder_label_elided_text()
+        self._relayout_timer.start()
+        # 仅高度变化时（拖动底部尺寸手柄）列数与标题宽度都不变
+        if event.size().width() != event.oldSize().width():
+            self._update_folder_label_elided_text()
         self.sizeChanged.emit(event.size())
 
     def clear_grid(self) -> None:
         if not self.grid_layout:
             return
-        while self.grid_layout.count():
-            item = self.grid_layout.takeAt(0)
-            if item and item.widget():
-                item.widget().deleteLater()
+        if self._loading_label and self._loading_label.parent() is not None:
+            self._loading_label.hide()
+            self._loading_label.setParent(None)
+        for widget in self._item_pool:
+            widget.item_index = -1
+            widget.hide()
+        self._bound_range = (0, 0)
+        if self.scroll_widget:
+            self.scroll_widget.setMinimumHeight(0)
 
     def paintEvent(self, event: QPaintEvent) -> None:
         super().paintEvent(event)
@@ -374,66 +629,133 @@ class DrawerContentWidget(QWidget):
             assert self.close_button is not None
             assert self.folder_label is not None
 
+            if self._header_metrics is None:
+                self._header_metrics = collect_header_metrics(
+                    self.header_layout,
+                    self.folder_icon_label,
+                    self.refresh_button,
+                    self.close_button,
+                )
             available_width = calculate_available_label_width(
-                self,
-                self.header_layout,
-                self.folder_icon_label,
-                self.refresh_button,
-                self.close_button,
-            )
-            fm = QFontMetrics(self.folder_label.font())
-            elided_text = fm.elidedText(
-                self.current_folder, Qt.TextElideMode.ElideLeft, available_width
+                self.width(), self._header_metrics
             )
-            self.folder_label.setText(elided_text)
-            self.folder_label.setToolTip(f"click to open: {self.current_folder}")
+            # 按 8px 向下取整，拖动时宽度的细小变化复用同一省略结果
+            available_width -= available_width % _ELIDE_WIDTH_STEP
+            cache = self._elided_cache
+            if (
+                cache is not None
+                and cache[0] == available_width
+                and cache[1] == self.current_folder
+            ):
+                elided_text = cache[2]
+            else:
+                fm = self._get_folder_label_metrics()
+                elided_text = fm.elidedText(
+                    self.current_folder, _ELIDE_LEFT, available_width
+                )
+                self._elided_cache = (
+                    available_width,
+                    self.current_folder,
+                    elided_text,
+                )
+            if self.folder_label.text() != elided_text:
+                self.folder_label.setText(elided_text)
+                self.folder_label.setToolTip(f"click to open: {self.current_folder}")
         except Exception as e:
             logging.error(f"Error updating folder label text: {e}")
             if self.folder_label:
                 self.folder_label.setText("...")
                 self.folder_label.setToolTip(self.current_folder)
 
+    def _get_folder_label_metrics(self) -> QFontMetrics:
+        """返回 folder_label 的字体度量，字体未变化时复用缓存。"""
+        assert self.folder_label is not None
+        font = self.folder_label.font()
+        font_key = font.key()
+        if self._folder_label_fm is None or font_key != self._folder_label_font_key:
+            self._folder_label_fm = QFontMetrics(font)
+            self._folder_label_font_key = font_key
+            self._elided_cache = None
+        return self._folder_label_fm
+
+    def changeEvent(self, event: QEvent) -> None:
+        if event.type() in (QEvent.Type.FontChange, QEvent.Type.StyleChange):
+            self._folder_label_fm = None
+            self._folder_label_font_key = None
+            self._elided_cache = None
+            self._header_metrics = None
+            self._invalidate_item_text()
+        super().changeEvent(event)
+
+    def _invalidate_item_text(self) -> None:
+        """字体变化后丢弃文件名度量与截断结果，并让可见项重新绑定。"""
+        self._item_fm = None
+        self._display_texts.clear()
+        for widget in self._item_pool:
+            widget.item_index = -1
+        self._bound_range = (0, 0)
+        self._relayout_timer.start()
+
+    def showEvent(self, event: QShowEvent) -> None:
+        super().showEvent(event)
+        if not self._screen_signal_connected:
+            handle = self.window().windowHandle()
+            if handle is not None:
+                handle.screenChanged.connect(self._on_screen_changed)
+                self._screen_signal_connected = True
+
+    def _on_screen_changed(self, _screen) -> None:
+        """切换屏幕后 DPI 可能变化，header 尺寸与省略文本需重新计算。"""
+        self._header_metrics = None
+        self._folder_label_fm = None
+        self._folder_label_font_key = None
+        self._elided_cache = None
+        self._update_folder_label_elided_text()
+
     def dragEnterEvent(self, event: QDragEnterEvent) -> None:
         if event.mimeData().hasUrls():
             event.acceptProposedAction()
         else:
             event.ignore()
 
+    def _set_drag_over(self, inside: bool) -> None:
+        """切换滚动区域的拖放高亮，仅在状态变化时重新 polish。"""
+        if inside == self._drag_inside or not self.scroll_area:
+            return
+        self._drag_inside = inside
+        self.scroll_area.setProperty("dragOver", inside)
+        style = self.scroll_area.style()
+        style.unpolish(self.scroll_area)
+        style.polish(self.scroll_area)
+        self.scroll_area.update()
+
     def dragMoveEvent(self, event: QDragMoveEvent) -> None:
         if event.mimeData().hasUrls() and self.scroll_area:
-            if self.scroll_area.geometry().contains(event.pos()):
-                self.scroll_area.setStyleSheet("border: 2px solid orange;")
-            else:
-                self.scroll_area.setStyleSheet("")
+            self._set_drag_over(self.scroll_area.geometry().contains(event.pos()))
             event.acceptProposedAction()
         else:
             event.ignore()
 
     def dragLeaveEvent(self, event: QDragLeaveEvent) -> None:
-        if self.scroll_area:
-            self.scroll_area.setStyleSheet("")
+        self._set_drag_over(False)
         event.accept()
 
+    def _on_files_transferred(self, dest_folder: str, errors: list) -> None:
+        if errors:
+            logging.warning(
+                f"{len(errors)} file(s) failed to transfer to {dest_folder}"
+            )
+        if dest_folder == self.current_folder:
+            self.update_content(dest_folder)
+
     def dropEvent(self, event: QDropEvent) -> None:
-        if self.scroll_area:
-            self.scroll_area.setStyleSheet("")
+        self._set_drag_over(False)
         if event.mimeData().hasUrls() and self.current_folder:
-            for url in event.mimeData().urls():
-                file_path = url.toLocalFile()
-                if os.path.isfile(file_path):
-                    src_drive = os.path.splitdrive(file_path)[0].upper()
-                    dest_drive = os.path.splitdrive(self.current_folder)[0].upper()
-                    dest_path = os.path.join(
-                        self.current_folder, os.path.basename(file_path)
-                    )
-                    try:
-                        if src_drive == dest_drive:
-                            shutil.move(file_path, dest_path)
-                        else:
-                            shutil.copy2(file_path, dest_path)
-                    except Exception as e:
-                        logging.error(f"Error transferring file {file_path}: {e}")
-            self.update_content(self.current_folder)
+            file_paths = [url.toLocalFile() for url in event.mimeData().urls()]
+            worker = FileTransferWorker(
+                self.current_folder, file_paths, self._transfer_signals
+            )
+            self.file_transfer_pool.start(worker)
             event.acceptProposedAction()
         else:
             event.ignore()
@@ -0,0 +1,55 @@
+import os
+import errno
+import shutil
+import stat
+import logging
+from typing import List, Tuple
+from PySide6.QtCore import QObject, QRunnable, Slot, Signal
+
+
+class FileTransferSignals(QObject):
+    # (目标文件夹, [(源路径, 错误信息), ...])
+    finished = Signal(str, list)
+
+
+class FileTransferWorker(QRunnable):
+    """在线程池中把拖入的文件移动/复制到目标文件夹，完成后一次性通知 UI。"""
+
+    def __init__(
+        self, dest_folder: str, file_paths: List[str], signals: FileTransferSignals
+    ):
+        super().__init__()
+        self.dest_folder = dest_folder
+        self.file_paths = file_paths
+        self.signals = signals
+
+    @Slot()
+    def run(self):
+        errors: List[Tuple[str, str]] = []
+        for file_path in self.file_paths:
+            try:
+                if not stat.S_ISREG(os.stat(file_path).st_mode):
+                    continue
+            except OSError:
+                continue
+            dest_path = os.path.join(self.dest_folder, os.path.basename(file_path))
+            try:
+                transfer_file(file_path, dest_path)
+            except Exception as e:
+                logging.error(f"Error transferring file {file_path}: {e}")
+                errors.append((file_path, str(e)))
+        self.signals.finished.emit(self.dest_folder, errors)
+
+
+def transfer_file(src_path: str, dest_path: str) -> None:
+    """
+    同一文件系统内直接 rename（一次系统调用）；跨设备时复制，保留源文件。
+    """
+    try:
+        os.rename(src_path, dest_path)
+    except OSError as e:
+        if e.errno == errno.EXDEV:
+            shutil.copy2(src_path, dest_path)
+        else:
+            # 例如目标已存在（Windows 下 rename 不覆盖），交给 shutil.move 处理
+            shutil.move(src_path, dest_path)
@@ -6,6 +6,7 @@ from PySide6.QtCore import QFileInfo, QSize
 from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import QFileIconProvider
 
+from modules.app_paths import resource_path
 from modules.icon_workers import (
     DirectoryIconWorker,
     FileIconWorker,
@@ -42,8 +43,10 @@ class DefaultIconProvider:
         self, folder_icon_path: str, file_icon_theme: str, unknown_icon_theme: str
     ):
         """加载默认文件夹、文件和未知图标，优先使用路径，其次使用主题图标。"""
-        if os.path.exists(folder_icon_path):
-            self._icons["folder"] = QIcon(folder_icon_path)
+        # 配置中的相对路径（如 asset/icons/...）相对于程序资源目录解析
+        resolved_folder_path = resource_path(folder_icon_path)
+        if os.path.exists(resolved_folder_path):
+            self._icons["folder"] = QIcon(resolved_folder_path)
         else:
             logging.warning(
                 f"默认文件夹图标路径无效，使用主题图标替代: {folder_icon_path}"
@@ -51,16 +54,18 @@ class DefaultIconProvider:
             self._icons["folder"] = QIcon.fromTheme("folder", QIcon())
 
         self._icons["file"] = QIcon.fromTheme(file_icon_theme, QIcon())
-        if os.path.exists(unknown_icon_theme):
-            self._icons["unknown"] = QIcon(unknown_icon_theme)
+        resolved_unknown_path = resource_path(unknown_icon_theme)
+        if os.path.exists(resolved_unknown_path):
+            self._icons["unknown"] = QIcon(resolved_unknown_path)
         else:
             self._icons["unknown"] = QIcon.fromTheme(unknown_icon_theme, QIcon())
 
     def _load_extension_icons(self, extension_icon_map: dict[str, str]):
         """根据扩展名映射加载对应图标，路径优先，其次主题图标。"""
         for ext, icon_path_or_theme in extension_icon_map.items():
-            if os.path.exists(icon_path_or_theme):
-                icon = QIcon(icon_path_or_theme)
+            resolved_path = resource_path(icon_path_or_theme)
+            if os.path.exists(resolved_path):
+                icon = QIcon(resolved_path)
             else:
                 icon = QIcon.fromTheme(icon_path_or_theme, QIcon())
             if not icon.isNull():
@@ -100,7 +105,7 @@ class ValidatedPathInfo(TypedDict):
 def validate_path(path: Optional[str]) -> Optional[ValidatedPathInfo]:
     """验证路径是否存在并返回结构化信息，失败返回None。"""
     if not isinstance(path, str) or not path:
-        logging.debug(f"路径无效或为空: {path}")
+        logging.debug("路径无效或为空: %s", path)
         return None
 
     try:
@@ -112,7 +117,7 @@ def validate_path(path: Optional[str]) -> Optional[ValidatedPathInfo]:
             _, ext = os.path.splitext(path)
             extension = ext.lower()
         else:
-            logging.debug(f"路径不存在或非文件/目录: {path}")
+            logging.debug("路径不存在或非文件/目录: %s", path)
             return None
     except OSError as e:
         logging.warning(f"路径验证异常: {path}, 错误: {e}")
@@ -139,26 +144,30 @@ class IconDispatcher:
         icon: Optional[QIcon] = None
 
         logging.debug(
-            f"Dispatching icon request for: {full_path} (Type: {path_type}, Ext: {extension})"
+            "Dispatching icon request for: %s (Type: %s, Ext: %s)",
+            full_path,
+            path_type,
+            extension,
         )
 
         # 新增：优先根据扩展名映射返回图标
         if path_type == "file" and extension:
             ext_icon = self.icon_provider.get_icon_for_extension(extension)
             if ext_icon is not None and not ext_icon.isNull():
-                logging.debug(f"Extension icon found for {extension} at {full_path}")
+                logging.debug("Extension icon found for %s at %s", extension, full_path)
                 return ext_icon
 
         if path_type == "file":
             if self.thumbnail_worker.can_handle(dict(path_info)):
-                logging.debug(f"Attempting ThumbnailWorker for: {full_path}")
+                logging.debug("Attempting ThumbnailWorker for: %s", full_path)
                 icon = self.thumbnail_worker.get_icon(dict(path_info))
                 if icon and not icon.isNull():
-                    logging.debug(f"ThumbnailWorker succeeded for: {full_path}")
+                    logging.debug("ThumbnailWorker succeeded for: %s", full_path)
                     return icon
                 else:
                     logging.debug(
-                        f"ThumbnailWorker failed or returned null for: {full_path}"
+                        "ThumbnailWorker failed or returned null for: %s",
+                        full_path,
                     )
 
         if (
@@ -167,48 +176,50 @@ class IconDispatcher:
             and extension == ".lnk"
             and _HAS_LNKPARSE
         ):
-            logging.debug(f"Attempting LnkWorker for: {full_path}")
+            logging.debug("Attempting LnkWorker for: %s", full_path)
             icon = self.lnk_worker.get_icon(dict(path_info), self.icon_provider)
             if icon and not icon.isNull():
-                logging.debug(f"LnkWorker succeeded for: {full_path}")
+                logging.debug("LnkWorker succeeded for: %s", full_path)
                 return icon
             else:
-                logging.debug(f"LnkWorker failed or returned null for: {full_path}")
+                logging.debug("LnkWorker failed or returned null for: %s", full_path)
 
         try:
-            logging.debug(f"Attempting QFileIconProvider for: {full_path}")
+            logging.debug("Attempting QFileIconProvider for: %s", full_path)
             file_info = QFileInfo(full_path)
             qt_icon = self._qt_icon_provider.icon(file_info)
             if not qt_icon.isNull():
-                logging.debug(f"QFileIconProvider succeeded for: {full_path}")
+                logging.debug("QFileIconProvider succeeded for: %s", full_path)
                 return qt_icon
             else:
-                logging.debug(f"QFileIconProvider returned null icon for: {full_path}")
+                logging.debug("QFileIconProvider returned null icon for: %s", full_path)
         except Exception as e:
             logging.error(
                 f"Error calling QFileIconProvider for '{full_path}': {e}", exc_info=True
             )
 
         if path_type == "directory":
-            logging.debug(f"Attempting DirectoryWorker for: {full_path}")
+            logging.debug("Attempting DirectoryWorker for: %s", full_path)
             icon = self.directory_worker.get_icon(dict(path_info), self.icon_provider)
             if icon and not icon.isNull():
-                logging.debug(f"DirectoryWorker succeeded for: {full_path}")
+                logging.debug("DirectoryWorker succeeded for: %s", full_path)
                 return icon
             else:
                 logging.debug(
-                    f"DirectoryWorker failed or returned null for: {full_path}"
+                    "DirectoryWorker failed or returned null for: %s",
+                    full_path,
                 )
 
         if path_type == "file":
-            logging.debug(f"Attempting FileWorker as fallback for: {full_path}")
+            logging.debug("Attempting FileWorker as fallback for: %s", full_path)
             icon = self.file_worker.get_icon(dict(path_info), self.icon_provider)
             if icon and not icon.isNull():
-                logging.debug(f"FileWorker succeeded for: {full_path}")
+                logging.debug("FileWorker succeeded for: %s", full_path)
                 return icon
             else:
                 logging.debug(
-                    f"FileWorker failed, returning generic file icon for: {full_path}"
+                    "FileWorker failed, returning generic file icon for: %s",
+                    full_path,
                 )
                 return self.icon_provider.get_file_icon()
 
@@ -1,11 +1,12 @@
 import logging
-from typing import Optional
+import threading
+from typing import Dict, List, Optional, Tuple
 from PySide6.QtCore import QObject, QRunnable, Slot, Signal
-from PySide6.QtWidgets import QWidget
 from PySide6.QtGui import QIcon
 
 from .settings_manager import SettingsManager
 from .icon_dispatcher import DefaultIconProvider, validate_path, IconDispatcher
+from .icon_workers import SUPPORTED_IMAGE_EXTENSIONS
 
 
 _icon_provider: Optional[DefaultIconProvider] = None
@@ -13,32 +14,65 @@ _icon_dispatcher: Optional[IconDispatcher] = None
 _unknown_icon: Optional[QIcon] = None
 _initialized = False
 
+# 按扩展名缓存的图标：同一扩展名的普通文件图标相同，无需每个文件都走一遍调度
+_EXTENSION_ICON_CACHE_MAX = 512
+_extension_icon_cache: Dict[str, QIcon] = {}
+_extension_icon_cache_lock = threading.Lock()
+# 这些扩展名的图标因文件而异（自带图标、快捷方式目标、缩略图），不参与缓存
+_UNCACHEABLE_EXTENSIONS = {".exe", ".lnk", ".ico", ".url"} | SUPPORTED_IMAGE_EXTENSIONS
+
+
+# BatchIconLoadWorker 每累计这么多个结果发射一次 batch_loaded
+ICON_BATCH_EMIT_SIZE = 16
+# 单个 BatchIconLoadWorker 最多处理的路径数，空闲线程可以及时领取剩余分块
+ICON_DISPATCH_CHUNK_SIZE = 32
+
 
 class IconWorkerSignals(QObject):
-    icon_loaded = Signal(QWidget, QIcon)
+    # (load_generation, [(item_index, icon), ...])
+    batch_loaded = Signal(int, list)
     error = Signal(str, str)
 
 
-class IconLoadWorker(QRunnable):
+class BatchIconLoadWorker(QRunnable):
+    """在一个 QRunnable 内依次加载一批图标，按块发射结果，减少调度与跨线程信号开销。"""
+
     def __init__(
-        self, file_path: str, target_widget: QWidget, signals: IconWorkerSignals
+        self,
+        generation: int,
+        paths: List[str],
+        widget_ids: List[int],
+        signals: IconWorkerSignals,
+        cancelled: threading.Event,
     ):
         super().__init__()
-        self.file_path = file_path
-        self.target_widget = target_widget
+        self.generation = generation
+        self.paths = paths
+        self.widget_ids = widget_ids
         self.signals = signals
+        self.cancelled = cancelled
 
     @Slot()
     def run(self):
-        try:
-            icon = get_icon_for_path(self.file_path)
-            if icon:
-                self.signals.icon_loaded.emit(self.target_widget, icon)
-            else:
-                logging.warning(f"Icon loading returned None for: {self.file_path}")
-        except Exception as e:
-            logging.error(f"Error loading icon for {self.file_path}: {e}")
-            self.signals.error.emit(self.file_path, str(e))
+        chunk: List[Tuple[int, QIcon]] = []
+        for widget_id, file_path in zip(self.widget_ids, self.paths):
+            if self.cancelled.is_set():
+                return
+            try:
+                icon = get_icon_for_path(file_path)
+            except Exception as e:
+                logging.error(f"Error loading icon for {file_path}: {e}")
+                self.signals.error.emit(file_path, str(e))
+                continue
+            if not icon:
+                logging.warning(f"Icon loading returned None for: {file_path}")
+                continue
+            chunk.append((widget_id, icon))
+            if len(chunk) >= ICON_BATCH_EMIT_SIZE:
+                self.signals.batch_loaded.emit(self.generation, chunk)
+                chunk = []
+        if chunk:
+            self.signals.batch_loaded.emit(self.generation, chunk)
 
 
 def _initialize_icon_components():
@@ -102,9 +136,28 @@ def get_icon_for_path(full_path: str) -> QIcon:
         )
         return local_unknown_icon
 
+    extension = validated_path_info["extension"]
+    cacheable = (
+        validated_path_info["path_type"] == "file"
+        and bool(extension)
+        and extension not in _UNCACHEABLE_EXTENSIONS
+    )
+    if cacheable:
+        with _extension_icon_cache_lock:
+            cached_icon = _extension_icon_cache.get(extension)
+        if cached_icon is not None:
+            return cached_icon
+
     try:
         icon = local_icon_dispatcher.dispatch(validated_path_info)
-        return icon if icon and not icon.isNull() else local_unknown_icon
+        if not icon or icon.isNull():
+            return local_unknown_icon
+        if cacheable:
+            with _extension_icon_cache_lock:
+                if len(_extension_icon_cache) >= _EXTENSION_ICON_CACHE_MAX:
+                    _extension_icon_cache.clear()
+                _extension_icon_cache[extension] = icon
+        return icon
     except Exception as e:
         logging.error(
             f"Error during icon dispatch for path '{full_path}': {e}", exc_info=True
@@ -14,6 +14,8 @@ class DrawerListWidget(QListWidget):
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
         self.setMouseTracking(True)
+        # 所有行都是单行文本，行高一致；免去逐项测量 sizeHint
+        self.setUniformItemSizes(True)
 
     def mousePressEvent(self, event) -> None:
         pos = event.position().toPoint()
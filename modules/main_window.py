@@ -11,11 +11,22 @@ from PySide6.QtWidgets import (
     QSystemTrayIcon,
     QMenu,
     QApplication,
+    QMessageBox,
+)
+from PySide6.QtCore import (
+    Qt,
+    QPoint,
+    QSize,
+    Signal,
+    QCoreApplication,
+    QSignalBlocker,
+    Slot,
+    QTimer,
 )
-from PySide6.QtCore import Qt, QPoint, QSize, Signal, QCoreApplication, Slot, QTimer
 from PySide6.QtGui import QMoveEvent, QAction, QIcon, QCloseEvent
 
-from modules.settings_manager import DrawerDict
+from modules.app_paths import resource_path
+from modules.settings_manager import Drawer
 from modules.list import DrawerListWidget
 from modules.drawer_ui import DrawerContentWidget
 from modules.window_drag_area import DragArea
@@ -25,6 +36,8 @@ if TYPE_CHECKING:
     from modules.controller import AppController
 from modules.controller import USER_ROLE
 
+TRANSIENT_WARNING_MS: int = 3000
+
 
 class MainWindow(QMainWindow):
     windowMoved = Signal(QPoint)
@@ -142,17 +155,24 @@ class MainWindow(QMainWindow):
         self.windowMoved.connect(self.controller.update_window_position)
         self.apply_initial_background()
 
-    def populate_drawer_list(self, drawers: List[DrawerDict]) -> None:
+    def populate_drawer_list(self, drawers: List[Drawer]) -> None:
         self.drawerList.clear()
-        for drawer_data in drawers:
-            name = drawer_data.get("name", "Unnamed Drawer")
-            item = QListWidgetItem(name)
-            item.setData(USER_ROLE, drawer_data)
-            self.drawerList.addItem(item)
-
-    def add_drawer_item(self, drawer: DrawerDict) -> None:
-        name = drawer.get("name", "Unnamed Drawer")
-        item = QListWidgetItem(name)
+        self.populate_drawer_list_tail(drawers)
+
+    def populate_drawer_list_tail(self, drawers: List[Drawer]) -> None:
+        """在已有列表项之后追加抽屉（启动时分批填充的后半段）。"""
+        # 批量填充期间屏蔽列表信号与重绘，避免每插入一行都触发一次回调/刷新
+        blocker = QSignalBlocker(self.drawerList)
+        self.drawerList.setUpdatesEnabled(False)
+        try:
+            for drawer_data in drawers:
+                self.add_drawer_item(drawer_data)
+        finally:
+            self.drawerList.setUpdatesEnabled(True)
+            blocker.unblock()
+
+    def add_drawer_item(self, drawer: Drawer) -> None:
+        item = QListWidgetItem(drawer.name or "Unnamed Drawer")
         item.setData(USER_ROLE, drawer)
         self.drawerList.addItem(item)
 
@@ -160,12 +180,12 @@ class MainWindow(QMainWindow):
         self.move(pos)
 
     def _on_show_drawer_content(
-        self, drawer_data: DrawerDict, target_size: QSize
+        self, drawer_data: Drawer, target_size: QSize
     ) -> None:
-        folder_path = drawer_data.get("path")
+        folder_path = drawer_data.path
         if not folder_path:
             logging.error(
-                f"Cannot show content for drawer '{drawer_data.get('name')}' - path missing."
+                f"Cannot show content for drawer '{drawer_data.name}' - path missing."
             )
             return
         if not self.drawerContent:
@@ -217,6 +237,23 @@ class MainWindow(QMainWindow):
     def clear_list_selection(self) -> None:
         self.drawerList.clearSelection()
 
+    def show_transient_warning(self, title: str, text: str) -> None:
+        """非模态提示，不阻塞事件循环；优先使用托盘通知。"""
+        tray_icon = getattr(self, "tray_icon", None)
+        if (
+            tray_icon is not None
+            and tray_icon.isVisible()
+            and QSystemTrayIcon.supportsMessages()
+        ):
+            tray_icon.showMessage(
+                title, text, QSystemTrayIcon.MessageIcon.Warning, TRANSIENT_WARNING_MS
+            )
+            return
+        box = QMessageBox(QMessageBox.Icon.Warning, title, text, parent=self)
+        box.setWindowModality(Qt.WindowModality.NonModal)
+        box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose, True)
+        box.show()
+
     @Slot(float, float, float, float)
     def set_background_color(
         self, h: float, s: float, l_float: float, a: float
@@ -258,7 +295,7 @@ class MainWindow(QMainWindow):
 
     def _create_tray_icon(self) -> None:
         self.tray_icon = QSystemTrayIcon(self)
-        icon_path = "asset/drawer.icon.4.ico"
+        icon_path = resource_path("asset/drawer.icon.4.ico")
         icon = QIcon(icon_path)
         if icon.isNull():
             logging.warning(f"Tray icon file '{icon_path}' not found or invalid.")
@@ -335,6 +372,8 @@ class MainWindow(QMainWindow):
             self.windowMoved.emit(self.pos())
 
     def closeEvent(self, event: QCloseEvent) -> None:
+        if self.controller:
+            self.controller.flush_pending_save()
         self.hide()
         event.ignore()
 
@@ -1,12 +1,16 @@
 import os
-import json
-from typing import List, Dict, Tuple, Optional, Any
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from pathlib import Path
 from PySide6.QtCore import QPoint, QSize
-from pydantic import BaseModel, ValidationError, Field, field_validator
+from pydantic import BaseModel, ValidationError, Field
 import logging  # Import logging
 
-SETTINGS_FILE: str = "drawers-settings.json"
+from modules.app_paths import app_data_path
+
+# 设置文件放在程序目录下，不依赖启动时的工作目录（开机自启时通常是 System32）
+SETTINGS_FILE: str = app_data_path("drawers-settings.json")
 
 
 # Pydantic Models for settings structure validation
@@ -16,16 +20,11 @@ class SizeModel(BaseModel):
 
 
 class DrawerModel(BaseModel):
+    # 路径是否存在只在 load_settings 处理阶段检查一次，保存时不做 stat
     name: str
     path: Path
     size: Optional[SizeModel] = None
 
-    @field_validator("path")
-    def path_must_exist(cls, v):
-        if not v.exists():
-            logging.warning(f"Path does not exist during validation: {v}")
-        return v
-
 
 class WindowPositionModel(BaseModel):
     x: int
@@ -52,7 +51,31 @@ class SettingsModel(BaseModel):
     )
 
 
-DrawerDict = Dict[str, Any]
+@dataclass(slots=True)
+class Drawer:
+    """运行时的抽屉配置；size 为 None 表示尚未保存过尺寸。"""
+
+    name: str
+    path: str
+    size: Optional[QSize] = None
+
+
+def _atomic_write(path: str, payload: bytes) -> None:
+    """
+    一次 write 写入临时文件并 fsync，再用 os.replace 原子替换目标文件。
+    中途中断时原文件保持完整，读取方也不会读到半截内容。
+    """
+    tmp_path = f"{path}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
 
 
 class SettingsManager:
@@ -71,7 +94,7 @@ class SettingsManager:
 
     @staticmethod
     def load_settings() -> Tuple[
-        List[DrawerDict],
+        List[Drawer],
         Optional[QPoint],
         Tuple[int, int, int, float],  # Return HSLA in CSS format
         bool,
@@ -89,23 +112,24 @@ class SettingsManager:
         settings: SettingsModel
         try:
             if os.path.exists(SETTINGS_FILE):
-                with open(SETTINGS_FILE, "r", encoding="utf-8") as f:
-                    raw_data = json.load(f)
-                settings = SettingsModel.model_validate(raw_data)
+                with open(SETTINGS_FILE, "rb") as f:
+                    raw_data = f.read()
+                # pydantic-core 直接解析并校验 JSON，省去 json.load 生成中间 dict
+                settings = SettingsModel.model_validate_json(raw_data)
                 logging.debug("Settings file loaded and validated.")
             else:
                 logging.warning(
                     f"Settings file '{SETTINGS_FILE}' not found. Using defaults."
                 )
                 settings = SettingsModel()  # Use default values from model
-        except (json.JSONDecodeError, ValidationError, OSError) as e:
+        except (ValidationError, OSError) as e:
             logging.error(
                 f"Error loading or validating config '{SETTINGS_FILE}': {e}. Using defaults."
             )
             settings = SettingsModel()  # Use default values on error
 
         # --- Process loaded or default settings ---
-        app_drawers: List[DrawerDict] = []
+        app_drawers: List[Drawer] = []
         if settings.drawers:  # Check if drawers list exists
             for drawer_model in settings.drawers:
                 try:
@@ -116,16 +140,16 @@ class SettingsManager:
                         )
                         continue
 
-                    drawer_dict: DrawerDict = {
-                        "name": drawer_model.name,
-                        "path": str(drawer_model.path),  # Store path as string
-                    }
+                    drawer = Drawer(
+                        name=drawer_model.name,
+                        path=str(drawer_model.path),  # Store path as string
+                    )
                     if drawer_model.size:
-                        drawer_dict["size"] = QSize(
+                        drawer.size = QSize(
                             drawer_model.size.width,
                             drawer_model.size.height,
                         )
-                    app_drawers.append(drawer_dict)
+                    app_drawers.append(drawer)
                 except Exception as drawer_err:
                     logging.error(
                         f"Error processing drawer '{drawer_model.name}': {drawer_err}"
@@ -199,7 +223,7 @@ class SettingsManager:
     @staticmethod
     def save_settings(
         # User-modifiable settings
-        drawers: List[DrawerDict],
+        drawers: List[Drawer],
         window_position: Optional[QPoint] = None,
         background_color_hsla: Optional[
             Tuple[int, int, int, float]
@@ -213,25 +237,26 @@ class SettingsManager:
             DEFAULT_THUMBNAIL_SIZE.width, DEFAULT_THUMBNAIL_SIZE.height
         ),
         extension_icon_map: Optional[Dict[str, str]] = None,
-    ) -> None:
+    ) -> bool:
         """
         Saves settings using Pydantic models for serialization.
         Uses provided values or falls back to defaults defined in the model or class.
+        Returns True if the settings were written to disk.
         """
         drawer_models: List[DrawerModel] = []
         if drawers:  # Check if drawers list is provided
-            for drawer_dict in drawers:
+            for drawer in drawers:
                 size_model: Optional[SizeModel] = None
-                if "size" in drawer_dict and isinstance(drawer_dict["size"], QSize):
-                    qsize = drawer_dict["size"]
+                if isinstance(drawer.size, QSize):
+                    qsize = drawer.size
                     size_model = SizeModel(width=qsize.width(), height=qsize.height())
 
                 try:
                     # Ensure path is stored correctly
-                    path_str = drawer_dict.get("path")
+                    path_str = drawer.path
                     if not path_str:
                         logging.error(
-                            f"Skipping drawer with missing path: {drawer_dict.get('name', 'N/A')}"
+                            f"Skipping drawer with missing path: {drawer.name or 'N/A'}"
                         )
                         continue
                     path_obj = Path(path_str)
@@ -240,13 +265,11 @@ class SettingsManager:
                     #     logging.warning(f"Path does not exist during save: {path_obj}")
 
                     drawer_models.append(
-                        DrawerModel(
-                            name=drawer_dict["name"], path=path_obj, size=size_model
-                        )
+                        DrawerModel(name=drawer.name, path=path_obj, size=size_model)
                     )
                 except Exception as e:
                     logging.error(
-                        f"Skipping invalid drawer during save: {drawer_dict.get('name', 'N/A')} - Error: {e}"
+                        f"Skipping invalid drawer during save: {drawer.name or 'N/A'} - Error: {e}"
                     )
 
         window_pos_model: Optional[WindowPositionModel] = None
@@ -279,21 +302,21 @@ class SettingsManager:
         try:
             # Validate before saving
             config_to_save = SettingsModel.model_validate(settings_data_cleaned)
-            data_to_save = config_to_save.model_dump(
-                mode="json"
-            )  # Use mode="json" for Path serialization
+            # 由 pydantic-core 直接序列化为 JSON（Path 转为字符串，非 ASCII 原样输出）
+            data_to_save = config_to_save.model_dump_json(indent=2)
         except ValidationError as e:
             logging.error(
                 f"Validation error before saving settings: {e}. Settings not saved."
             )
-            return
+            return False
 
         try:
-            with open(SETTINGS_FILE, "w", encoding="utf-8") as f:
-                json.dump(data_to_save, f, indent=2, ensure_ascii=False)
+            _atomic_write(SETTINGS_FILE, data_to_save.encode("utf-8"))
             logging.debug(f"Settings successfully saved to {SETTINGS_FILE}")
-        except OSError as e:
-            logging.error(f"Error saving config to {SETTINGS_FILE}: {e}")
+            return True
+        except OSError:
+            logging.exception(f"Error saving config to {SETTINGS_FILE}")
+            return False
 
         # Keep these helper methods as they might still be useful,
         # but note they now load ALL settings just to return one piece.
@@ -310,3 +333,64 @@ class SettingsManager:
         """Loads settings and returns only the start with windows flag."""
         settings = SettingsManager.load_settings()
         return settings[3]  # Index for start_flag
+
+
+class SettingsWriter:
+    """
+    在后台线程中调用 SettingsManager.save_settings。
+    只保留最新一次提交的快照（latest wins），UI 线程提交后立即返回。
+    写入失败时在写线程中调用 on_error。
+    """
+
+    def __init__(self, on_error: Optional[Callable[[], None]] = None) -> None:
+        self._on_error = on_error
+        self._cond = threading.Condition()
+        self._pending: Optional[Dict[str, Any]] = None
+        self._busy = False
+        self._stopped = False
+        self._thread = threading.Thread(
+            target=self._run, name="SettingsWriter", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, **settings: Any) -> None:
+        """提交一份 save_settings 参数快照，覆盖尚未写入的旧快照。"""
+        with self._cond:
+            self._pending = settings
+            self._cond.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """等待已提交的快照全部写入磁盘，超时返回 False。"""
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: self._pending is None and not self._busy, timeout
+            )
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """写完剩余快照后结束线程。"""
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending is not None or self._stopped)
+                if self._pending is None:
+                    return  # stopped，且没有待写入的快照
+                settings = self._pending
+                self._pending = None
+                self._busy = True
+            try:
+                saved = SettingsManager.save_settings(**settings)
+            except Exception as e:
+                logging.error(f"Error writing settings in background: {e}")
+                saved = False
+            try:
+                if not saved and self._on_error is not None:
+                    self._on_error()
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
@@ -1,103 +1,105 @@
 import logging
-from PySide6.QtWidgets import QLabel, QHBoxLayout, QWidget, QPushButton
+from typing import NamedTuple, Optional
+from PySide6.QtWidgets import QLabel, QHBoxLayout, QPushButton
 from PySide6.QtGui import QFontMetrics
-from PySide6.QtCore import Qt
 
 
-def truncate_text(text: str, label: QLabel, available_width: int) -> str:
+def text_metrics_for(fm: QFontMetrics, available_width: int) -> int:
     """
-    根据可用宽度截断文本以适应显示 (最多 2 行)。
+    根据字体度量预先计算每行可容纳的字符数，供同一轮多次 truncate_text 复用。
     """
-    fm = QFontMetrics(label.font())
     if available_width <= 0:
         available_width = 50  # 默认小宽度
+    avg_char_width = fm.averageCharWidth() or 6
+    return max(1, available_width // avg_char_width)
 
-    elided_line1 = fm.elidedText(text, Qt.TextElideMode.ElideRight, available_width)
-    if (
-        fm.boundingRect(elided_line1).width() <= available_width
-        and "\n" not in elided_line1
-    ):
-        if elided_line1 == text:
-            return text  # 原文一行可显示
 
-    avg_char_width = fm.averageCharWidth() or 6
-    chars_per_line = max(1, available_width // avg_char_width)
+def truncate_text(
+    text: str, fm: QFontMetrics, available_width: int, chars_per_line: int
+) -> str:
+    """
+    根据可用宽度截断文本以适应显示 (最多 2 行)。
+    fm 与 chars_per_line 由调用方在一次填充中只计算一次后传入。
+    """
     max_chars_two_lines = chars_per_line * 2
+    # 平均字宽只对 ASCII 文本可靠，CJK 等宽字符需要实际测量
+    if text.isascii() and len(text) <= max_chars_two_lines:
+        return text
+
+    if available_width <= 0:
+        available_width = 50  # 默认小宽度
 
-    if len(text) > max_chars_two_lines:
-        truncated_text = text[: max_chars_two_lines - 3] + "..."
-    else:
-        truncated_text = text
+    # 一次测量即可判断：一行或两行内放得下都直接返回原文
+    max_width = available_width * 2
+    if fm.horizontalAdvance(text) <= max_width:
+        return text
 
-    return truncated_text
+    # 二分查找两行宽度内（留出省略号）能容纳的最长前缀
+    budget = max_width - fm.horizontalAdvance("...")
+    lo, hi = 0, len(text)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if fm.horizontalAdvance(text[:mid]) <= budget:
+            lo = mid
+        else:
+            hi = mid - 1
+    return text[:lo] + "..."
 
 
-def calculate_available_label_width(
-    container_widget: QWidget,
+class HeaderMetrics(NamedTuple):
+    """header 中除 folder_label 外的固定开销，只在字体/样式/屏幕变化时才需重算。"""
+
+    # 边距、按钮、图标、间距与缓冲的总宽度；可用宽度 = 容器宽度 - fixed_overhead
+    fixed_overhead: int
+
+
+def collect_header_metrics(
     header_layout: QHBoxLayout,
     icon_label: QLabel,
     refresh_button: QPushButton,
     close_button: QPushButton,
-) -> int:
+) -> Optional[HeaderMetrics]:
     """
-    计算 header 中 folder_label 的可用宽度。
-    需要传入主容器、头部布局及图标、刷新按钮和关闭按钮部件。
+    读取 header 中固定部分的尺寸并合计，失败时返回 None。
+    按钮与图标使用 sizeHint，布局尚未激活时也能得到稳定的值。
     """
-    if not all(
-        [container_widget, header_layout, icon_label, refresh_button, close_button]
-    ):
-        logging.warning(
-            "calculate_available_label_width: Missing required widgets/layout."
-        )
-        return 100
-
-    header_total_width = container_widget.width()
-    header_margins = header_layout.contentsMargins()
-    header_available_width = (
-        header_total_width - header_margins.left() - header_margins.right()
-    )
-
-    refresh_button_width = (
-        refresh_button.sizeHint().width()
-        if refresh_button.width() <= 0
-        else refresh_button.width()
-    )
-    close_button_width = (
-        close_button.sizeHint().width()
-        if close_button.width() <= 0
-        else close_button.width()
-    )
-    header_spacing = header_layout.spacing()
+    if not all([header_layout, icon_label, refresh_button, close_button]):
+        logging.warning("collect_header_metrics: Missing required widgets/layout.")
+        return None
 
     folder_container = icon_label.parentWidget()
     if not folder_container:
-        logging.warning(
-            "calculate_available_label_width: Icon label has no parent widget."
-        )
-        return 100
+        logging.warning("collect_header_metrics: Icon label has no parent widget.")
+        return None
     folder_layout = folder_container.layout()
     if not folder_layout:
-        logging.warning(
-            "calculate_available_label_width: Folder container has no layout."
-        )
-        return 100
+        logging.warning("collect_header_metrics: Folder container has no layout.")
+        return None
 
+    header_margins = header_layout.contentsMargins()
     folder_margins = folder_layout.contentsMargins()
-    folder_spacing = folder_layout.spacing()
-    icon_width = (
-        icon_label.sizeHint().width() if icon_label.width() <= 0 else icon_label.width()
+    fixed_overhead = (
+        header_margins.left()
+        + header_margins.right()
+        + refresh_button.sizeHint().width()
+        + close_button.sizeHint().width()
+        + header_layout.spacing() * 2
+        + folder_margins.left()
+        + icon_label.sizeHint().width()
+        + folder_layout.spacing()
+        + folder_margins.right()
+        + 5  # buffer
     )
+    return HeaderMetrics(fixed_overhead=fixed_overhead)
 
-    available_width = (
-        header_available_width
-        - refresh_button_width
-        - close_button_width
-        - header_spacing * 2
-        - folder_margins.left()
-        - icon_width
-        - folder_spacing
-        - folder_margins.right()
-        - 5  # buffer
-    )
 
-    return max(20, available_width)
+def calculate_available_label_width(
+    container_width: int, metrics: Optional[HeaderMetrics]
+) -> int:
+    """
+    计算 header 中 folder_label 的可用宽度。
+    只有容器宽度随 resize 变化，固定开销由 collect_header_metrics 预先合计。
+    """
+    if metrics is None:
+        return 100
+    return max(20, container_width - metrics.fixed_overhead)